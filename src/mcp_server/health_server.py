@@ -1,70 +1,142 @@
 """
-FastAPI Health Server for MCP
+Health Server for MCP
 Provides HTTP health endpoints while MCP runs on SSE transport
+
+Implemented as a minimal ASGI app: the handful of parameterless GET routes don't
+need a framework's routing, middleware or response-class machinery.
 """
 
-import asyncio
-import json
 import time
+from collections.abc import Callable
 from datetime import datetime
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+import orjson
 import uvicorn
 import logging
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Archon MCP Health Server")
-
-# Track server startup time
-startup_time = time.time()
-
-@app.get("/health")
-async def health():
-    """Health check endpoint for archon-server to query"""
-    uptime = time.time() - startup_time
-    return JSONResponse(content={
-        "status": "running",
-        "uptime": uptime,
-        "uptime_seconds": uptime,
-        "service": "archon-mcp",
-        "transport": "sse",
-        "timestamp": datetime.now().isoformat(),
-        "health": {
-            "status": "healthy",
-            "api_service": True,
-            "last_health_check": datetime.now().isoformat()
-        }
-    })
+# Monotonic server start time, so uptime is immune to wall-clock jumps
+_startup_mono = time.monotonic()
+
+# Formatted timestamp reused for every request within the same second: [epoch_second, iso_string]
+_ts_cache = [0, ""]
+
+def _now_iso():
+    """Current local time as an ISO string at one-second granularity"""
+    now = int(time.time())
+    if _ts_cache[0] != now:
+        _ts_cache[0] = now
+        _ts_cache[1] = datetime.fromtimestamp(now).isoformat()
+    return _ts_cache[1]
+
+# Static portion of the /health payload; only uptime and timestamps vary per request
+_HEALTH_BASE = {
+    "status": "running",
+    "service": "archon-mcp",
+    "transport": "sse",
+    "health": {
+        "status": "healthy",
+        "api_service": True,
+    },
+}
 
-@app.get("/")
-async def root():
-    """Root endpoint"""
-    return {"service": "archon-mcp-health", "status": "running"}
-
-@app.get("/clients")
-async def get_clients():
-    """Get connected MCP clients"""
-    return {
-        "clients": [],
-        "total": 0,
-        "message": "Client tracking not implemented for SSE transport"
-    }
-
-@app.get("/sessions")
-async def get_sessions():
-    """Get MCP sessions"""
-    uptime = time.time() - startup_time
-    return {
+def _health_body():
+    """Health check payload for archon-server to query"""
+    uptime = time.monotonic() - _startup_mono
+    iso = _now_iso()
+    payload = {**_HEALTH_BASE, "uptime": uptime, "uptime_seconds": uptime, "timestamp": iso}
+    payload["health"] = {**_HEALTH_BASE["health"], "last_health_check": iso}
+    return orjson.dumps(payload)
+
+def _sessions_body():
+    """MCP sessions payload"""
+    uptime = time.monotonic() - _startup_mono
+    return orjson.dumps({
         "active_sessions": 0,
         "session_timeout": 3600,
         "server_uptime_seconds": uptime
-    }
+    })
+
+_ROOT_BYTES = orjson.dumps({"service": "archon-mcp-health", "status": "running"})
+_CLIENTS_BYTES = orjson.dumps({
+    "clients": [],
+    "total": 0,
+    "message": "Client tracking not implemented for SSE transport"
+})
+_NOT_FOUND_BYTES = orjson.dumps({"detail": "Not Found"})
+_METHOD_NOT_ALLOWED_BYTES = orjson.dumps({"detail": "Method Not Allowed"})
+
+# Path -> static body bytes, or a callable building the body per request
+_ROUTES: dict[str, bytes | Callable[[], bytes]] = {
+    "/": _ROOT_BYTES,
+    "/clients": _CLIENTS_BYTES,
+    "/sessions": _sessions_body,
+    "/health": _health_body,
+}
+
+_CONTENT_TYPE = (b"content-type", b"application/json")
+
+async def app(scope, receive, send):
+    """ASGI entrypoint serving the health routes"""
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    if scope["type"] != "http":
+        return
+
+    path = scope["path"]
+    # Accept one trailing slash (e.g. /health/), which FastAPI used to redirect
+    if len(path) > 1 and path.endswith("/"):
+        path = path[:-1]
+    body = _ROUTES.get(path)
+    if body is None:
+        status, body = 404, _NOT_FOUND_BYTES
+    elif scope["method"] not in ("GET", "HEAD"):
+        status, body = 405, _METHOD_NOT_ALLOWED_BYTES
+    else:
+        status = 200
+        if callable(body):
+            body = body()
+
+    # Explicit content-length avoids chunked transfer encoding; HEAD reports the GET length
+    headers = [_CONTENT_TYPE, (b"content-length", str(len(body)).encode())]
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+class _ReadyServer(uvicorn.Server):
+    """uvicorn server that sets a threading.Event once its listening socket is bound
+
+    uvicorn runs ASGI lifespan startup before binding, so the event can't be set from there.
+    """
+
+    def __init__(self, config, ready_event=None):
+        super().__init__(config)
+        self.ready_event = ready_event
+
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        if self.started and self.ready_event is not None:
+            self.ready_event.set()
+
+def _create_server(host, port, ready_event=None):
+    """Build the uvicorn server for the health app"""
+    # Health endpoints are machine-polled, so skip access logging. uvicorn's default
+    # "auto" loop/http settings pick uvloop and httptools whenever they are installed.
+    config = uvicorn.Config(app, host=host, port=port, log_level="error", access_log=False)
+    return _ReadyServer(config, ready_event)
+
+def run_health_server(host="0.0.0.0", port=8052, ready_event=None):
+    """Run the health server on a different port
 
-def run_health_server(host="0.0.0.0", port=8052):
-    """Run the health server on a different port"""
-    logger.info(f"Starting FastAPI health server on {host}:{port}")
-    uvicorn.run(app, host=host, port=port, log_level="error")
+    If ready_event (a threading.Event) is given, it is set once the server accepts connections.
+    """
+    logger.info(f"Starting health server on {host}:{port}")
+    _create_server(host, port, ready_event).run()
 
 if __name__ == "__main__":
     run_health_server()
\ No newline at end of file
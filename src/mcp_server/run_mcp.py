@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 """
-Run both MCP SSE server and FastAPI health server
+Run both MCP SSE server and HTTP health server
 """
 
 import os
@@ -19,13 +19,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Set by the health server once it is accepting connections
+health_ready = threading.Event()
+
 def run_health_server():
-    """Run the FastAPI health server in a thread"""
+    """Run the HTTP health server in a thread"""
     from src.mcp_server.health_server import run_health_server as start_health
     logger.info("Starting health server thread...")
     # Health server runs on the main MCP port for /health endpoint
     port = int(os.getenv("ARCHON_MCP_PORT", "8051"))
-    start_health(host="0.0.0.0", port=port)
+    start_health(host="0.0.0.0", port=port, ready_event=health_ready)
 
 def run_mcp_server():
     """Run the main MCP SSE server"""
@@ -48,9 +51,9 @@ if __name__ == "__main__":
         health_thread = threading.Thread(target=run_health_server, daemon=True)
         health_thread.start()
         
-        # Give health server a moment to start
-        import time
-        time.sleep(2)
+        # Wait for the health server to come up instead of sleeping a fixed time
+        if not health_ready.wait(timeout=10):
+            logger.warning("Health server did not signal readiness within 10s, continuing")
         
         # Run MCP server in main thread
         run_mcp_server()
@@ -6,148 +6,319 @@ The MCP container is managed by docker-compose (local) or as a microservice (Rai
 """
 
 import os
+import threading
+import time
+from datetime import datetime
 from typing import Any
 import aiohttp
 import asyncio
+import orjson
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import JSONResponse
+
+# Docker SDK is only needed for local deployments; import it once up front
+try:
+    import docker
+    from docker.errors import DockerException, NotFound
+
+    _HAS_DOCKER = True
+except ImportError:
+    _HAS_DOCKER = False
 
 # Import unified logging
 from ..config.logfire_config import api_logger, safe_set_attribute, safe_span
 
-router = APIRouter(prefix="/api/mcp", tags=["mcp"])
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (FastAPI's own ORJSONResponse is deprecated)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+router = APIRouter(prefix="/api/mcp", tags=["mcp"], default_response_class=ORJSONResponse)
+
+# Set for HTTP proxy (Railway) deployments, unset for local Docker; read once since it doesn't change at runtime
+_MCP_SERVER_URL = os.getenv("MCP_SERVER_URL")
+# Base URL for proxied requests, without a trailing slash
+_MCP_PROXY_URL = _MCP_SERVER_URL.rstrip("/") if _MCP_SERVER_URL else None
+
+# Shared HTTP session for proxying to the archon-mcp microservice (keeps connections alive)
+_http_session: aiohttp.ClientSession | None = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get the shared aiohttp session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=5),
+        )
+    return _http_session
+
+
+async def close_http_session():
+    """Close the shared aiohttp session (called on application shutdown)."""
+    global _http_session
+    if _http_session is not None:
+        await _http_session.close()
+        _http_session = None
+
+
+def _json(payload: dict[str, Any], status_code: int = 200) -> Response:
+    """Serialize a payload with orjson, bypassing FastAPI's jsonable_encoder pass."""
+    return Response(orjson.dumps(payload), status_code=status_code, media_type="application/json")
+
+
+# Shared empty log list for status payloads (log streaming was removed)
+_EMPTY_LOGS: tuple = ()
+
+
+def _err(container_status: str, error: str) -> dict[str, Any]:
+    """Build an error status payload."""
+    return {
+        "status": "error",
+        "uptime": None,
+        "logs": _EMPTY_LOGS,
+        "container_status": container_status,
+        "error": error,
+    }
+
+
+def _ok(uptime: Any, **extras: Any) -> dict[str, Any]:
+    """Build a running status payload, with any extra fields appended."""
+    return {
+        "status": "running",
+        "uptime": uptime,
+        "logs": _EMPTY_LOGS,
+        "container_status": "running",
+        **extras,
+    }
+
+
+# Fixed payloads built once at import
+_EMPTY_CLIENTS_BYTES = orjson.dumps({"clients": [], "total": 0})
+
+
+# Single-flight state for the upstream /health probe: concurrent callers share one request
+_STATUS_CACHE_TTL = 1.0
+_status_cache: tuple[float, dict[str, Any]] | None = None
+_status_inflight: asyncio.Task | None = None
+
+
+def _fresh_cached_status() -> dict[str, Any] | None:
+    """Return the cached MCP status if it is still within its TTL, else None."""
+    if _status_cache is not None and time.monotonic() - _status_cache[0] < _STATUS_CACHE_TTL:
+        return _status_cache[1]
+    return None
 
 
 async def get_container_status_http() -> dict[str, Any]:
+    """Get MCP status via HTTP, coalescing concurrent callers into one upstream request."""
+    global _status_inflight
+    cached = _fresh_cached_status()
+    if cached is not None:
+        return cached
+
+    if _status_inflight is None:
+        _status_inflight = asyncio.create_task(_refresh_container_status_http())
+    # Shield so a cancelled caller does not cancel the fetch shared with other callers
+    return await asyncio.shield(_status_inflight)
+
+
+async def _refresh_container_status_http() -> dict[str, Any]:
+    """Fetch MCP status and update the short-lived status cache."""
+    global _status_cache, _status_inflight
+    try:
+        status = await _fetch_container_status_http()
+        _status_cache = (time.monotonic(), status)
+        return status
+    finally:
+        _status_inflight = None
+
+
+async def _fetch_container_status_http() -> dict[str, Any]:
     """Get MCP status via HTTP from the archon-mcp microservice."""
-    mcp_url = os.getenv("MCP_SERVER_URL", "").rstrip("/")
-    
-    if not mcp_url:
-        return {
-            "status": "error",
-            "uptime": None,
-            "logs": [],
-            "container_status": "error",
-            "error": "MCP_SERVER_URL not configured"
-        }
+    if not _MCP_PROXY_URL:
+        return _err("error", "MCP_SERVER_URL not configured")
     
     try:
         # Try to get status from the MCP microservice
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{mcp_url}/health", timeout=aiohttp.ClientTimeout(total=5)) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "status": "running",
-                        "uptime": data.get("uptime"),
-                        "logs": [],
-                        "container_status": "running",
-                        "service_info": data
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "uptime": None,
-                        "logs": [],
-                        "container_status": "error",
-                        "error": f"MCP service returned status {response.status}"
-                    }
+        async with get_http_session().get(f"{_MCP_PROXY_URL}/health") as response:
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                return _ok(data.get("uptime"), service_info=data)
+            else:
+                return _err("error", f"MCP service returned status {response.status}")
     except asyncio.TimeoutError:
-        return {
-            "status": "error",
-            "uptime": None,
-            "logs": [],
-            "container_status": "timeout",
-            "error": "MCP service timeout - service may be starting"
-        }
+        return _err("timeout", "MCP service timeout - service may be starting")
     except Exception as e:
-        return {
-            "status": "error",
-            "uptime": None,
-            "logs": [],
-            "container_status": "error",
-            "error": f"Failed to connect to MCP service: {str(e)}"
-        }
+        return _err("error", f"Failed to connect to MCP service: {str(e)}")
+
+
+# Docker client shared across status polls (keeps the dockerd socket open)
+# Status lookups run in worker threads, so creation and replacement are guarded by a lock
+_docker_client = None
+_docker_lock = threading.Lock()
+# Set once docker.from_env() fails (no reachable daemon, e.g. on Railway) so the status probe stops racing Docker
+_docker_unavailable = False
+
+
+def _get_docker():
+    """Get the shared Docker client, creating it on first use."""
+    global _docker_client, _docker_unavailable
+    client = _docker_client
+    if client is None:
+        with _docker_lock:
+            if _docker_client is None:
+                try:
+                    _docker_client = docker.from_env()
+                except DockerException:
+                    _docker_unavailable = True
+                    raise
+                _docker_unavailable = False
+            client = _docker_client
+    return client
+
+
+def _discard_docker_client(client) -> None:
+    """Forget a failed Docker client so the next call reconnects.
+
+    The client isn't closed here since other worker threads may still be using it.
+    """
+    global _docker_client
+    with _docker_lock:
+        if _docker_client is client:
+            _docker_client = None
+
+
+def close_docker_client():
+    """Close the shared Docker client (called on application shutdown)."""
+    global _docker_client
+    with _docker_lock:
+        client, _docker_client = _docker_client, None
+    if client is not None:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+# Last parsed container StartedAt as (raw string, epoch seconds) - only changes on restart
+_started_at_cache: tuple[str, float] | None = None
+
+
+def _started_at_epoch(started_at: str) -> float:
+    """Convert Docker's StartedAt timestamp to epoch seconds, parsing once per container start."""
+    global _started_at_cache
+    if _started_at_cache is None or _started_at_cache[0] != started_at:
+        started_time = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+        _started_at_cache = (started_at, started_time.timestamp())
+    return _started_at_cache[1]
 
 
 def get_container_status_docker() -> dict[str, Any]:
     """Get MCP container status using Docker (for local deployments)."""
+    if not _HAS_DOCKER:
+        # Docker not available, likely on Railway
+        return _err("no_docker", "Docker not available in this environment")
+
+    client = None
     try:
-        import docker
-        from docker.errors import NotFound
-        
-        docker_client = None
-        try:
-            docker_client = docker.from_env()
-            container = docker_client.containers.get("archon-mcp")
+        client = _get_docker()
+        # Low-level inspect avoids building a Container object and lazy-loading attrs
+        info = client.api.inspect_container("archon-mcp")
 
-            # Get container status
-            container_status = container.status
+        # Get container status
+        container_status = info["State"]["Status"]
 
-            # Map Docker statuses to simple statuses
-            if container_status == "running":
-                status = "running"
-                # Try to get uptime from container info
-                try:
-                    from datetime import datetime
-                    started_at = container.attrs["State"]["StartedAt"]
-                    started_time = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
-                    uptime = int((datetime.now(started_time.tzinfo) - started_time).total_seconds())
-                except Exception:
-                    uptime = None
-            else:
-                status = "stopped"
+        # Map Docker statuses to simple statuses
+        if container_status == "running":
+            status = "running"
+            # Try to get uptime from container info
+            try:
+                uptime = int(time.time() - _started_at_epoch(info["State"]["StartedAt"]))
+            except Exception:
                 uptime = None
+        else:
+            status = "stopped"
+            uptime = None
 
-            return {
-                "status": status,
-                "uptime": uptime,
-                "logs": [],  # No log streaming anymore
-                "container_status": container_status
-            }
+        return {
+            "status": status,
+            "uptime": uptime,
+            "logs": _EMPTY_LOGS,  # No log streaming anymore
+            "container_status": container_status
+        }
 
-        except NotFound:
-            return {
-                "status": "not_found",
-                "uptime": None,
-                "logs": [],
-                "container_status": "not_found",
-                "message": "MCP container not found. Run: docker compose up -d archon-mcp"
-            }
-        except Exception as e:
-            api_logger.error("Failed to get container status", exc_info=True)
-            return {
-                "status": "error",
-                "uptime": None,
-                "logs": [],
-                "container_status": "error",
-                "error": str(e)
-            }
-        finally:
-            if docker_client is not None:
-                try:
-                    docker_client.close()
-                except Exception:
-                    pass
-    except ImportError:
-        # Docker not available, likely on Railway
+    except NotFound:
         return {
-            "status": "error",
+            "status": "not_found",
             "uptime": None,
-            "logs": [],
-            "container_status": "no_docker",
-            "error": "Docker not available in this environment"
+            "logs": _EMPTY_LOGS,
+            "container_status": "not_found",
+            "message": "MCP container not found. Run: docker compose up -d archon-mcp"
         }
+    except Exception as e:
+        api_logger.error("Failed to get container status", exc_info=True)
+        # Drop the cached client so the next call reconnects
+        if client is not None:
+            _discard_docker_client(client)
+        return _err("error", str(e))
+
+
+# Opt-in: race the HTTP and Docker probes when MCP_SERVER_URL is set (helps during startup/outages)
+_SPECULATIVE_STATUS_PROBE = os.getenv("MCP_SPECULATIVE_STATUS_PROBE", "false").lower() == "true"
+_PROBE_TIMEOUT = 5.0
+
+
+async def _probe_container_status() -> dict[str, Any]:
+    """Run the HTTP and Docker probes concurrently and return the first running result.
+
+    If neither reports running, the HTTP result is preferred since MCP_SERVER_URL is configured.
+    Docker is skipped once it is known to be unreachable, so deployments without a daemon
+    don't spawn a failing lookup (and error log) on every stale poll.
+    """
+    if not _HAS_DOCKER or _docker_unavailable:
+        return await get_container_status_http()
+
+    http_task = asyncio.create_task(get_container_status_http())
+    docker_task = asyncio.create_task(asyncio.to_thread(get_container_status_docker))
+    pending = {http_task, docker_task}
+    deadline = time.monotonic() + _PROBE_TIMEOUT
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=max(deadline - time.monotonic(), 0),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                break
+            for task in done:
+                if task.result().get("status") == "running":
+                    return task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if http_task.done() and not http_task.cancelled():
+        return http_task.result()
+    return _err("timeout", "MCP service timeout - service may be starting")
 
 
 async def get_container_status() -> dict[str, Any]:
     """Get MCP status - tries HTTP first (for Railway), falls back to Docker (for local)."""
     # Check if we have MCP_SERVER_URL configured (Railway deployment)
-    if os.getenv("MCP_SERVER_URL"):
+    if _MCP_PROXY_URL:
+        if _SPECULATIVE_STATUS_PROBE and _fresh_cached_status() is None:
+            return await _probe_container_status()
         return await get_container_status_http()
     else:
-        # Fall back to Docker for local deployments
-        return get_container_status_docker()
+        # Fall back to Docker for local deployments (blocking SDK, so keep it off the event loop)
+        return await asyncio.to_thread(get_container_status_docker)
 
 
 @router.get("/status")
@@ -162,46 +333,55 @@ async def get_status():
             api_logger.debug(f"MCP server status checked - status={status.get('status')}")
             safe_set_attribute(span, "status", status.get("status"))
             safe_set_attribute(span, "uptime", status.get("uptime"))
-            return status
+            return _json(status)
         except Exception as e:
             api_logger.error(f"MCP server status API failed - error={str(e)}")
             safe_set_attribute(span, "error", str(e))
             raise HTTPException(status_code=500, detail=str(e))
 
 
+# Environment-derived MCP settings don't change at runtime, so read them once
+_MCP_PORT = int(os.getenv("ARCHON_MCP_PORT", "8051"))
+_MCP_HOST = _MCP_SERVER_URL.split("://", 1)[-1].split(":", 1)[0] if _MCP_SERVER_URL else "localhost"
+
+if _MCP_SERVER_URL:
+    # Railway deployment - use proxy URL
+    _BASE_CONFIG: dict[str, Any] = {
+        "host": _MCP_HOST,
+        "port": _MCP_PORT,
+        "transport": "streamable-http",
+        "proxy_url": _MCP_SERVER_URL,
+        "deployment": "railway",
+    }
+else:
+    # Local Docker deployment
+    _BASE_CONFIG = {
+        "host": _MCP_HOST,
+        "port": _MCP_PORT,
+        "transport": "streamable-http",
+        "deployment": "docker",
+    }
+
+_CONFIG_CACHE_TTL = 30.0
+_config_cache: tuple[float, dict[str, Any]] | None = None
+
+
 @router.get("/config")
 async def get_mcp_config():
     """Get MCP server configuration."""
+    global _config_cache
     with safe_span("api_get_mcp_config") as span:
         safe_set_attribute(span, "endpoint", "/api/mcp/config")
         safe_set_attribute(span, "method", "GET")
 
         try:
+            # Serve from cache while fresh - model choice rarely changes
+            if _config_cache is not None and time.monotonic() - _config_cache[0] < _CONFIG_CACHE_TTL:
+                return _config_cache[1]
+
             api_logger.info("Getting MCP server configuration")
 
-            # Get actual MCP port from environment or use default
-            mcp_port = int(os.getenv("ARCHON_MCP_PORT", "8051"))
-            
-            # Check if we're using HTTP proxy (Railway) or local Docker
-            mcp_server_url = os.getenv("MCP_SERVER_URL")
-            
-            if mcp_server_url:
-                # Railway deployment - use proxy URL
-                config = {
-                    "host": mcp_server_url.replace("http://", "").replace("https://", "").split(":")[0],
-                    "port": mcp_port,
-                    "transport": "streamable-http",
-                    "proxy_url": mcp_server_url,
-                    "deployment": "railway"
-                }
-            else:
-                # Local Docker deployment
-                config = {
-                    "host": "localhost",
-                    "port": mcp_port,
-                    "transport": "streamable-http",
-                    "deployment": "docker"
-                }
+            config = _BASE_CONFIG.copy()
 
             # Get only model choice from database (simplified)
             try:
@@ -211,8 +391,9 @@ async def get_mcp_config():
                     "MODEL_CHOICE", "gpt-4o-mini"
                 )
                 config["model_choice"] = model_choice
+                _config_cache = (time.monotonic(), config)
             except Exception:
-                # Fallback to default model
+                # Fallback to default model (not cached so the lookup is retried)
                 config["model_choice"] = "gpt-4o-mini"
 
             api_logger.info(f"MCP configuration ({config.get('deployment', 'unknown')} mode)")
@@ -238,36 +419,37 @@ async def get_mcp_clients():
 
         try:
             # Check if we should query the MCP microservice
-            mcp_server_url = os.getenv("MCP_SERVER_URL")
-            
-            if mcp_server_url:
+            if _MCP_PROXY_URL:
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(f"{mcp_server_url}/clients", 
-                                              timeout=aiohttp.ClientTimeout(total=5)) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                return {
-                                    "clients": data.get("clients", []),
-                                    "total": data.get("total", 0)
-                                }
+                    async with get_http_session().get(f"{_MCP_PROXY_URL}/clients") as response:
+                        if response.status == 200:
+                            data = orjson.loads(await response.read())
+                            return _json({
+                                "clients": data.get("clients", []),
+                                "total": data.get("total", 0)
+                            })
                 except Exception as e:
                     api_logger.debug(f"Could not get clients from MCP service: {e}")
             
             # Default empty response
             api_logger.debug("Getting MCP clients - returning empty array")
-            return {
-                "clients": [],
-                "total": 0
-            }
+            return Response(_EMPTY_CLIENTS_BYTES, media_type="application/json")
         except Exception as e:
             api_logger.error(f"Failed to get MCP clients - error={str(e)}")
             safe_set_attribute(span, "error", str(e))
-            return {
+            return _json({
                 "clients": [],
                 "total": 0,
                 "error": str(e)
-            }
+            })
+
+
+async def _fetch_mcp_sessions(mcp_server_url: str) -> dict[str, Any] | None:
+    """Get session info from the MCP microservice, or None on a non-200 response."""
+    async with get_http_session().get(f"{mcp_server_url}/sessions") as response:
+        if response.status == 200:
+            return orjson.loads(await response.read())
+    return None
 
 
 @router.get("/sessions")
@@ -279,21 +461,25 @@ async def get_mcp_sessions():
 
         try:
             # Check if we should query the MCP microservice
-            mcp_server_url = os.getenv("MCP_SERVER_URL")
-            
-            if mcp_server_url:
-                try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(f"{mcp_server_url}/sessions",
-                                              timeout=aiohttp.ClientTimeout(total=5)) as response:
-                            if response.status == 200:
-                                return await response.json()
-                except Exception as e:
-                    api_logger.debug(f"Could not get sessions from MCP service: {e}")
-            
-            # Basic session info fallback
-            status = await get_container_status()
+            if _MCP_PROXY_URL:
+                # Probe status alongside /sessions so the fallback doesn't cost another round trip.
+                # gather waits for both, so even a successful /sessions reply waits on the status probe
+                # (usually served from the 1s status cache).
+                sessions, status = await asyncio.gather(
+                    _fetch_mcp_sessions(_MCP_PROXY_URL),
+                    get_container_status_http(),
+                    return_exceptions=True,
+                )
+                if isinstance(sessions, BaseException):
+                    api_logger.debug(f"Could not get sessions from MCP service: {sessions}")
+                elif sessions is not None:
+                    return _json(sessions)
+                if isinstance(status, BaseException):
+                    raise status
+            else:
+                status = await get_container_status()
 
+            # Basic session info fallback
             session_info = {
                 "active_sessions": 0,  # TODO: Implement real session tracking
                 "session_timeout": 3600,  # 1 hour default
@@ -306,22 +492,19 @@ async def get_mcp_sessions():
             api_logger.debug(f"MCP session info - sessions={session_info.get('active_sessions')}")
             safe_set_attribute(span, "active_sessions", session_info.get("active_sessions"))
 
-            return session_info
+            return _json(session_info)
         except Exception as e:
             api_logger.error(f"Failed to get MCP sessions - error={str(e)}")
             safe_set_attribute(span, "error", str(e))
             raise HTTPException(status_code=500, detail=str(e))
 
 
+# /health payload never changes, so serialize it once
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "mcp"})
+
+
 @router.get("/health")
 async def mcp_health():
     """Health check for MCP API - used by bug report service and tests."""
-    with safe_span("api_mcp_health") as span:
-        safe_set_attribute(span, "endpoint", "/api/mcp/health")
-        safe_set_attribute(span, "method", "GET")
-
-        # Simple health check - no logging to reduce noise
-        result = {"status": "healthy", "service": "mcp"}
-        safe_set_attribute(span, "status", "healthy")
-
-        return result
\ No newline at end of file
+    # Simple health check - no logging or tracing span to reduce noise and overhead
+    return Response(_HEALTH_BYTES, media_type="application/json")
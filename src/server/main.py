@@ -18,11 +18,14 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from .api_routes.agent_chat_api import router as agent_chat_router
 from .api_routes.bug_report_api import router as bug_report_router
 from .api_routes.internal_api import router as internal_router
 from .api_routes.knowledge_api import router as knowledge_router
+from .api_routes.mcp_api import close_docker_client as close_mcp_docker_client
+from .api_routes.mcp_api import close_http_session as close_mcp_http_session
 from .api_routes.mcp_api import router as mcp_router
 from .api_routes.progress_api import router as progress_router
 from .api_routes.projects_api import router as projects_router
@@ -151,6 +154,17 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             api_logger.warning("Could not cleanup background task manager", error=str(e))
 
+        # Close pooled HTTP session and Docker client used to query the MCP service
+        try:
+            await close_mcp_http_session()
+        except Exception as e:
+            api_logger.warning(f"Could not close MCP HTTP session: {e}")
+
+        try:
+            close_mcp_docker_client()
+        except Exception as e:
+            api_logger.warning(f"Could not close MCP Docker client: {e}")
+
         api_logger.info("✅ Cleanup completed")
 
     except Exception as e:
@@ -174,6 +188,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (e.g. /api/mcp/status); small health payloads fall under the
+# size threshold and are sent as-is. Level 1 keeps the CPU cost negligible for polled endpoints.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=1)
+
 
 # Add middleware to skip logging for health checks
 @app.middleware("http")
@@ -0,0 +1,135 @@
+"""Unit tests for the MCP health server."""
+
+import socket
+import threading
+
+import httpx
+import pytest
+
+from src.mcp_server.health_server import _create_server, app
+
+
+@pytest.fixture
+async def client():
+    """HTTP client wired directly to the health ASGI app."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+class TestHealthRoutes:
+    """Tests for the health server's routes."""
+
+    @pytest.mark.asyncio
+    async def test_health(self, client):
+        """Test that /health reports running status with uptime and timestamps."""
+        response = await client.get("/health")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["content-length"] == str(len(response.content))
+        data = response.json()
+        assert data["status"] == "running"
+        assert data["service"] == "archon-mcp"
+        assert data["transport"] == "sse"
+        assert data["uptime"] == data["uptime_seconds"]
+        assert data["uptime"] >= 0
+        assert data["health"]["status"] == "healthy"
+        assert data["health"]["last_health_check"] == data["timestamp"]
+
+    @pytest.mark.asyncio
+    async def test_root(self, client):
+        """Test the root endpoint."""
+        response = await client.get("/")
+
+        assert response.status_code == 200
+        assert response.json() == {"service": "archon-mcp-health", "status": "running"}
+
+    @pytest.mark.asyncio
+    async def test_clients(self, client):
+        """Test that /clients returns an empty client list."""
+        response = await client.get("/clients")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["clients"] == []
+        assert data["total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_sessions(self, client):
+        """Test that /sessions reports session info with server uptime."""
+        response = await client.get("/sessions")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["active_sessions"] == 0
+        assert data["session_timeout"] == 3600
+        assert data["server_uptime_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_path_returns_404(self, client):
+        """Test that unknown paths return 404."""
+        response = await client.get("/nope")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Not Found"}
+
+    @pytest.mark.asyncio
+    async def test_trailing_slash_is_accepted(self, client):
+        """Test that a known path with a trailing slash is served like the bare path."""
+        response = await client.get("/health/")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "running"
+
+    @pytest.mark.asyncio
+    async def test_non_get_method_returns_405(self, client):
+        """Test that non-GET methods on known paths return 405."""
+        response = await client.post("/health")
+
+        assert response.status_code == 405
+        assert response.json() == {"detail": "Method Not Allowed"}
+
+    @pytest.mark.asyncio
+    async def test_head_returns_headers_without_body(self, client):
+        """Test that HEAD sends the GET content-length but no body."""
+        get_response = await client.get("/")
+        head_response = await client.head("/")
+
+        assert head_response.status_code == 200
+        assert head_response.content == b""
+        assert head_response.headers["content-length"] == str(len(get_response.content))
+
+
+@pytest.mark.asyncio
+async def test_lifespan_startup_and_shutdown_complete():
+    """Test that the app acknowledges ASGI lifespan startup and shutdown."""
+    messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+    sent = []
+
+    async def receive():
+        return next(messages)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    await app({"type": "lifespan"}, receive, send)
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+
+def test_ready_event_set_after_socket_bound():
+    """Test that the ready event is only set once the server accepts connections."""
+    ready = threading.Event()
+    server = _create_server("127.0.0.1", 0, ready_event=ready)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    try:
+        assert ready.wait(timeout=10)
+
+        port = server.servers[0].sockets[0].getsockname()[1]
+        # Connecting immediately after the signal must not be refused
+        with socket.create_connection(("127.0.0.1", port), timeout=1):
+            pass
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
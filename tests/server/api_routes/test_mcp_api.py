@@ -0,0 +1,288 @@
+"""Unit tests for MCP API status proxying and config caching."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset_status_cache():
+    """Clear the module-level status and config caches between tests."""
+    from src.server.api_routes import mcp_api
+
+    mcp_api._status_cache = None
+    mcp_api._status_inflight = None
+    mcp_api._config_cache = None
+    yield
+    mcp_api._status_cache = None
+    mcp_api._status_inflight = None
+    mcp_api._config_cache = None
+
+
+class TestContainerStatusSingleFlight:
+    """Tests for coalescing concurrent MCP status probes."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_upstream_request(self):
+        """Test that concurrent status calls trigger a single upstream fetch."""
+        from src.server.api_routes import mcp_api
+
+        calls = 0
+
+        async def fake_fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"status": "running", "uptime": 42}
+
+        with patch.object(mcp_api, "_fetch_container_status_http", side_effect=fake_fetch):
+            results = await asyncio.gather(*(mcp_api.get_container_status_http() for _ in range(5)))
+
+        assert calls == 1
+        assert all(result["uptime"] == 42 for result in results)
+
+    @pytest.mark.asyncio
+    async def test_fresh_cache_skips_upstream_request(self):
+        """Test that a cached status is reused within the TTL."""
+        from src.server.api_routes import mcp_api
+
+        async def fake_fetch():
+            return {"status": "running", "uptime": 1}
+
+        with patch.object(mcp_api, "_fetch_container_status_http", side_effect=fake_fetch) as mock_fetch:
+            await mcp_api.get_container_status_http()
+            await mcp_api.get_container_status_http()
+
+        assert mock_fetch.call_count == 1
+
+
+class TestSpeculativeStatusProbe:
+    """Tests for racing the HTTP and Docker status probes."""
+
+    @pytest.mark.asyncio
+    async def test_returns_first_running_result(self):
+        """Test that a running Docker result wins over a slow HTTP probe."""
+        from src.server.api_routes import mcp_api
+
+        async def slow_http():
+            await asyncio.sleep(1)
+            return {"status": "running", "uptime": 1, "source": "http"}
+
+        with patch.object(mcp_api, "get_container_status_http", side_effect=slow_http), \
+             patch.object(mcp_api, "get_container_status_docker",
+                          return_value={"status": "running", "uptime": 2, "source": "docker"}):
+            result = await mcp_api._probe_container_status()
+
+        assert result["source"] == "docker"
+
+    @pytest.mark.asyncio
+    async def test_prefers_http_result_when_nothing_is_running(self):
+        """Test that the HTTP error is reported when neither probe succeeds."""
+        from src.server.api_routes import mcp_api
+
+        async def failing_http():
+            await asyncio.sleep(0.01)
+            return {"status": "error", "container_status": "error", "error": "boom"}
+
+        with patch.object(mcp_api, "get_container_status_http", side_effect=failing_http), \
+             patch.object(mcp_api, "get_container_status_docker",
+                          return_value={"status": "error", "container_status": "no_docker"}):
+            result = await mcp_api._probe_container_status()
+
+        assert result["error"] == "boom"
+
+    @pytest.mark.asyncio
+    async def test_unreachable_docker_is_not_retried(self):
+        """Test that HTTP wins when Docker is unreachable and later probes skip Docker."""
+        from src.server.api_routes import mcp_api
+
+        async def slow_http():
+            await asyncio.sleep(0.05)
+            return {"status": "running", "uptime": 1, "source": "http"}
+
+        mcp_api._docker_client = None
+        mcp_api._docker_unavailable = False
+        try:
+            with patch.object(mcp_api, "get_container_status_http", side_effect=slow_http), \
+                 patch.object(mcp_api.docker, "from_env",
+                              side_effect=mcp_api.DockerException("no daemon")) as mock_from_env, \
+                 patch.object(mcp_api.api_logger, "error") as mock_error:
+                first = await mcp_api._probe_container_status()
+                second = await mcp_api._probe_container_status()
+        finally:
+            mcp_api._docker_unavailable = False
+
+        assert first["source"] == "http"
+        assert second["source"] == "http"
+        assert mock_from_env.call_count == 1
+        assert mock_error.call_count == 1
+
+
+class TestSharedDockerClient:
+    """Tests for the Docker client shared across status worker threads."""
+
+    @pytest.fixture(autouse=True)
+    def reset_docker_client(self):
+        """Clear the shared Docker client between tests."""
+        from src.server.api_routes import mcp_api
+
+        mcp_api._docker_client = None
+        yield
+        mcp_api._docker_client = None
+
+    def test_concurrent_first_calls_create_one_client(self):
+        """Test that racing threads share a single lazily created client."""
+        from src.server.api_routes import mcp_api
+
+        def slow_from_env():
+            time.sleep(0.05)
+            return MagicMock()
+
+        results = []
+        with patch.object(mcp_api.docker, "from_env", side_effect=slow_from_env) as mock_from_env:
+            threads = [threading.Thread(target=lambda: results.append(mcp_api._get_docker())) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_from_env.call_count == 1
+        assert all(client is results[0] for client in results)
+
+    def test_error_discards_client_without_closing_it(self):
+        """Test that a failed lookup drops the cached client but leaves it open for other threads."""
+        from src.server.api_routes import mcp_api
+
+        client = MagicMock()
+        client.api.inspect_container.side_effect = Exception("socket error")
+        mcp_api._docker_client = client
+
+        result = mcp_api.get_container_status_docker()
+
+        assert result["status"] == "error"
+        assert mcp_api._docker_client is None
+        client.close.assert_not_called()
+
+    def test_error_keeps_replacement_client(self):
+        """Test that discarding a stale client does not drop a newer one."""
+        from src.server.api_routes import mcp_api
+
+        stale, fresh = MagicMock(), MagicMock()
+        mcp_api._docker_client = fresh
+
+        mcp_api._discard_docker_client(stale)
+
+        assert mcp_api._docker_client is fresh
+
+
+class TestMcpConfigCache:
+    """Tests for caching the MCP config credential lookup."""
+
+    @pytest.mark.asyncio
+    async def test_config_reuses_cached_model_choice(self):
+        """Test that repeated config requests hit the credential service once."""
+        from src.server.api_routes.mcp_api import get_mcp_config
+
+        mock_get = AsyncMock(return_value="gpt-4o")
+        with patch("src.server.services.credential_service.credential_service.get_credential", mock_get):
+            first = await get_mcp_config()
+            second = await get_mcp_config()
+
+        assert first["model_choice"] == "gpt-4o"
+        assert second == first
+        assert mock_get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_config_fallback_is_not_cached(self):
+        """Test that a failed credential lookup is retried on the next request."""
+        from src.server.api_routes.mcp_api import get_mcp_config
+
+        mock_get = AsyncMock(side_effect=Exception("db unavailable"))
+        with patch("src.server.services.credential_service.credential_service.get_credential", mock_get):
+            first = await get_mcp_config()
+            await get_mcp_config()
+
+        assert first["model_choice"] == "gpt-4o-mini"
+        assert mock_get.await_count == 2
+
+
+class TestMcpSessions:
+    """Tests for proxying MCP session info."""
+
+    @pytest.fixture(autouse=True)
+    def proxy_url(self):
+        """Configure the MCP proxy URL for these tests."""
+        from src.server.api_routes import mcp_api
+
+        with patch.object(mcp_api, "_MCP_PROXY_URL", "http://mcp:8051"):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_upstream_sessions_are_returned(self):
+        """Test that a 200 from the MCP /sessions endpoint is passed through."""
+        import orjson
+
+        from src.server.api_routes import mcp_api
+
+        async def fake_sessions(url):
+            return {"active_sessions": 3}
+
+        async def fake_status():
+            return {"status": "running", "uptime": 10}
+
+        with patch.object(mcp_api, "_fetch_mcp_sessions", side_effect=fake_sessions) as mock_sessions, \
+             patch.object(mcp_api, "get_container_status_http", side_effect=fake_status):
+            response = await mcp_api.get_mcp_sessions()
+
+        assert orjson.loads(response.body) == {"active_sessions": 3}
+        mock_sessions.assert_called_once_with("http://mcp:8051")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sessions_result", [None, Exception("connection refused")])
+    async def test_fallback_uses_status_uptime(self, sessions_result):
+        """Test that a non-200 or failed /sessions call falls back to the status uptime."""
+        import orjson
+
+        from src.server.api_routes import mcp_api
+
+        async def fake_sessions(url):
+            if isinstance(sessions_result, Exception):
+                raise sessions_result
+            return sessions_result
+
+        async def fake_status():
+            return {"status": "running", "uptime": 10}
+
+        with patch.object(mcp_api, "_fetch_mcp_sessions", side_effect=fake_sessions), \
+             patch.object(mcp_api, "get_container_status_http", side_effect=fake_status):
+            response = await mcp_api.get_mcp_sessions()
+
+        assert orjson.loads(response.body) == {
+            "active_sessions": 0,
+            "session_timeout": 3600,
+            "server_uptime_seconds": 10,
+        }
+
+    @pytest.mark.asyncio
+    async def test_status_failure_returns_500(self):
+        """Test that a failed status probe is surfaced as a 500 when /sessions is unavailable."""
+        from fastapi import HTTPException
+
+        from src.server.api_routes import mcp_api
+
+        async def fake_sessions(url):
+            return None
+
+        async def failing_status():
+            raise RuntimeError("status probe failed")
+
+        with patch.object(mcp_api, "_fetch_mcp_sessions", side_effect=fake_sessions), \
+             patch.object(mcp_api, "get_container_status_http", side_effect=failing_status):
+            with pytest.raises(HTTPException) as exc_info:
+                await mcp_api.get_mcp_sessions()
+
+        assert exc_info.value.status_code == 500
+        assert exc_info.value.detail == "status probe failed"